@@ -1,11 +1,18 @@
-import re
+from setuptools import setup, find_packages
 
-from setuptools import setup
 
-__version__ = re.findall(
-    r"""__version__ = ["']+([0-9\.\-dev]*)["']+""",
-    open('openmdao/__init__.py').read(),
-)[0]
+def _scan_version():
+    # exec only the version line so none of the rest of openmdao/__init__.py gets run
+    version_ns = {}
+    with open('openmdao/__init__.py') as f:
+        for line in f:
+            if line.startswith('__version__'):
+                exec(line, version_ns)
+                break
+    return version_ns['__version__']
+
+
+__version__ = _scan_version()
 
 optional_dependencies = {
     'docs': [
@@ -42,11 +49,11 @@ optional_dependencies = {
 }
 
 # Add an optional dependency that concatenates all others
-optional_dependencies['all'] = sorted([
+optional_dependencies['all'] = sorted({
     dependency
     for dependencies in optional_dependencies.values()
     for dependency in dependencies
-])
+})
 
 setup(
     name='openmdao',
@@ -77,45 +84,9 @@ setup(
     author_email='openmdao@openmdao.org',
     url='http://openmdao.org',
     license='Apache License, Version 2.0',
-    packages=[
-        'openmdao',
-        'openmdao.approximation_schemes',
-        'openmdao.code_review',
-        'openmdao.components',
-        'openmdao.components.interp_util',
-        'openmdao.core',
-        'openmdao.devtools',
-        'openmdao.devtools.iprofile_app',
-        'openmdao.docs',
-        'openmdao.docs.openmdao_book',
-        'openmdao.drivers',
-        'openmdao.error_checking',
-        'openmdao.jacobians',
-        'openmdao.matrices',
-        'openmdao.proc_allocators',
-        'openmdao.recorders',
-        'openmdao.solvers',
-        'openmdao.solvers.linear',
-        'openmdao.solvers.linesearch',
-        'openmdao.solvers.nonlinear',
-        'openmdao.surrogate_models',
-        'openmdao.surrogate_models.nn_interpolators',
-        'openmdao.test_suite',
-        'openmdao.test_suite.components',
-        'openmdao.test_suite.groups',
-        'openmdao.test_suite.test_examples',
-        'openmdao.test_suite.test_examples.beam_optimization',
-        'openmdao.test_suite.test_examples.beam_optimization.components',
-        'openmdao.test_suite.test_examples.cannonball',
-        'openmdao.test_suite.test_examples.meta_model_examples',
-        'openmdao.utils',
-        'openmdao.vectors',
-        'openmdao.visualization',
-        'openmdao.visualization.connection_viewer',
-        'openmdao.visualization.scaling_viewer',
-        'openmdao.visualization.n2_viewer',
-        'openmdao.visualization.meta_model_viewer',
-    ],
+    packages=find_packages(include=['openmdao', 'openmdao.*'],
+                           exclude=['*.tests', '*.tests.*',
+                                    'openmdao.devtools.docs_experiment*']),
     package_data={
         'openmdao.devtools': ['*.wpr', ],
         'openmdao.visualization': [